@@ -2,7 +2,10 @@
 import serial
 import time
 import argparse
+import functools
 import logging
+import struct
+import sys
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -23,7 +26,7 @@ def read_config(ser):
     return response[3:12]  # Return 9 bytes of configuration data
 
 def write_config(ser, config):
-    command = bytes([0xC0, 0x00, 0x09] + config)
+    command = b'\xC0\x00\x09' + bytes(config)
     response = send_command(ser, command)
     if response[0:3] != bytes([0xC1, 0x00, 0x09]):
         raise ValueError(f"Failed to write configuration: {response.hex()}")
@@ -42,32 +45,57 @@ def read_product_info(ser):
         raise ValueError(f"Unexpected response length or format for product info: {response.hex()}")
     return response[3:10]  # Return 7 bytes of product information
 
+# Decode tables, indexed directly by the masked register bit fields
+_AIR_RATES = ("0.3k", "1.2k", "2.4k", "4.8k", "9.6k", "19.2k", "38.4k", "62.5k")  # REG0 [2:0]
+_BAUD_RATES = ("1200", "2400", "4800", "9600", "19200", "38400", "57600", "115200")  # REG0 [7:5]
+_PARITIES = ("8N1", "8O1", "8E1", "8N1")  # REG0 [4:3], code 3 is 8N1 as well
+_POWERS = ("13dBm", "18dBm", "22dBm", "27dBm")  # REG1 [1:0]
+
+# Flag strings shared by every parse_config result
+_ENABLED = sys.intern("Enabled")
+_DISABLED = sys.intern("Disabled")
+_FIXED_POINT = sys.intern("Fixed-point")
+_TRANSPARENT = sys.intern("Transparent")
+
+# REG0 -> (air rate, baud rate, parity) for every possible register value
+_REG0_LUT = tuple(
+    (_AIR_RATES[v & 0x07], _BAUD_RATES[(v >> 5) & 0x07], _PARITIES[(v >> 3) & 0x03])
+    for v in range(256)
+)
+
+# REG1 -> (power, RSSI enable); bit 5 is assumed to be RSSI enable
+_REG1_LUT = tuple(
+    (_POWERS[v & 0x03], _ENABLED if v & 0x20 else _DISABLED)
+    for v in range(256)
+)
+
+# REG3 -> (noise enable, fixed transmission, relay, LBT) from bits 7..4
+_REG3_LUT = tuple(
+    (_ENABLED if v & 0x80 else _DISABLED,
+     _FIXED_POINT if v & 0x40 else _TRANSPARENT,
+     _ENABLED if v & 0x20 else _DISABLED,
+     _ENABLED if v & 0x10 else _DISABLED)
+    for v in range(256)
+)
+
+# Upper-case hex for every byte value, with and without the "0x" prefix
+_HEX2B = tuple("%02X" % v for v in range(256))
+_HEX2 = tuple("0x" + h for h in _HEX2B)
+
+_unpack_config = struct.Struct(">9B").unpack  # ADDH ADDL NETID REG0-REG3 + 2 trailing bytes
+
 def parse_config(config):
-    addh, addl, netid, reg0, reg1, reg2, reg3, reg4, reg5 = config
-    address = (addh << 8) | addl
-    network_address = netid
+    if len(config) != 9:
+        raise ValueError(f"Expected 9 bytes of configuration data, got {len(config)}")
+    addh, addl, netid, reg0, reg1, reg2, reg3, reg4, reg5 = _unpack_config(bytes(config))
     channel = reg2
-    air_rate_code = reg0 & 0x07
-    air_rates = ["0.3k", "1.2k", "2.4k", "4.8k", "9.6k", "19.2k", "38.4k", "62.5k"]
-    air_rate = air_rates[air_rate_code] if air_rate_code < len(air_rates) else "Unknown"
-    baud_rate_code = (reg0 >> 5) & 0x07  # Updated to account for more baud rates
-    baud_rates = ["1200", "2400", "4800", "9600", "19200", "38400", "57600", "115200"]
-    baud_rate = baud_rates[baud_rate_code] if baud_rate_code < len(baud_rates) else "Unknown"
-    parity_code = (reg0 >> 3) & 0x03
-    parities = ["8N1", "8O1", "8E1", "8N1"]
-    parity = parities[parity_code]
-    power_code = reg1 & 0x03
-    powers = ["13dBm", "18dBm", "22dBm", "27dBm"]
-    power = powers[power_code] if power_code < len(powers) else "Unknown"
-    fixed_transmission = "Fixed-point" if reg3 & 0x40 else "Transparent"  # Bit 6 for fixed-point transmission
-    relay_function = "Enabled" if reg3 & 0x20 else "Disabled"  # Bit 5 for relay function
-    lbt_enable = "Enabled" if reg3 & 0x10 else "Disabled"  # Bit 4 for LBT enable
-    rssi_enable = "Enabled" if reg1 & 0x20 else "Disabled"  # Assuming RSSI enable in REG1
-    noise_enable = "Enabled" if reg3 & 0x80 else "Disabled"  # Bit 7 for Noise enable in REG3
+    air_rate, baud_rate, parity = _REG0_LUT[reg0]
+    power, rssi_enable = _REG1_LUT[reg1]
+    noise_enable, fixed_transmission, relay_function, lbt_enable = _REG3_LUT[reg3]
     
     return {
-        "Address": f"0x{address:04X}",
-        "Network Address": f"0x{network_address:02X}",
+        "Address": _HEX2[addh] + _HEX2B[addl],
+        "Network Address": _HEX2[netid],
         "Channel": channel,
         "Air Rate": air_rate,
         "Baud Rate": baud_rate,
@@ -80,18 +108,34 @@ def parse_config(config):
         "Noise Enable": noise_enable  # New entry for noise enablement
     }
 
+# Encode tables: option string -> register bit-field code
+_AIR_CODE = {rate: code for code, rate in enumerate(_AIR_RATES)}
+_BAUD_CODE = {rate: code for code, rate in enumerate(_BAUD_RATES)}
+_PARITY_CODE = {"8N1": 0, "8O1": 1, "8E1": 2}
+_POWER_CODE = {power: code for code, power in enumerate(_POWERS)}
+
+# (air rate, baud rate, parity) -> complete REG0 value
+_REG0_PACK = {
+    (air, baud, parity): (baud_code << 5) | (parity_code << 3) | air_code
+    for air, air_code in _AIR_CODE.items()
+    for baud, baud_code in _BAUD_CODE.items()
+    for parity, parity_code in _PARITY_CODE.items()
+}
+
 def create_config(address, network_address, channel, air_rate, baud_rate, parity, power, fixed_transmission, relay_function, lbt_enable, rssi_enable, noise_enable="0"):
-    addh = (address >> 8) & 0xFF
-    addl = address & 0xFF
-    netid = network_address
+    # Identical settings are packed only once; callers get their own mutable copy
+    return bytearray(_create_config_cached(address, network_address, channel, air_rate, baud_rate, parity, power,
+                                           fixed_transmission, relay_function, lbt_enable, rssi_enable, noise_enable))
 
-    air_rates = {"0.3k": 0, "1.2k": 1, "2.4k": 2, "4.8k": 3, "9.6k": 4, "19.2k": 5, "38.4k": 6, "62.5k": 7}
-    baud_rates = {"1200": 0, "2400": 1, "4800": 2, "9600": 3, "19200": 4, "38400": 5, "57600": 6, "115200": 7}
-    parities = {"8N1": 0, "8O1": 1, "8E1": 2}
-    powers = {"13dBm": 0, "18dBm": 1, "22dBm": 2, "27dBm": 3}
+@functools.lru_cache(maxsize=256)
+def _create_config_cached(address, network_address, channel, air_rate, baud_rate, parity, power, fixed_transmission, relay_function, lbt_enable, rssi_enable, noise_enable):
+    config = bytearray(9)  # REG4/REG5 stay zero
+    config[0] = (address >> 8) & 0xFF  # ADDH
+    config[1] = address & 0xFF  # ADDL
+    config[2] = network_address  # NETID
 
-    reg0 = (baud_rates[baud_rate] << 5) | (parities[parity] << 3) | air_rates[air_rate]
-    reg1 = 0xE0 | powers[power]  # Base configuration for REG1
+    reg0 = _REG0_PACK[(air_rate, baud_rate, parity)]
+    reg1 = 0xE0 | _POWER_CODE[power]  # Base configuration for REG1
 
     # Modify REG1 for RSSI enable:
     if rssi_enable == "1":
@@ -123,25 +167,23 @@ def create_config(address, network_address, channel, air_rate, baud_rate, parity
     else:
         reg3 &= ~0x10  # Disable LBT by clearing bit 4
 
-    reg4 = 0
-    reg5 = 0
-
-    return [addh, addl, netid, reg0, reg1, reg2, reg3, reg4, reg5]
+    config[3] = reg0
+    config[4] = reg1
+    config[5] = reg2
+    config[6] = reg3
+    return bytes(config)
 
 def read_rssi(ser):
     command = bytes([0xC0, 0xC1, 0xC2, 0xC3, 0x00, 0x02])
     response = send_command(ser, command)
     
-    # Check if the response matches the expected format
-    if len(response) != 5 or response.hex()[:6] != 'c10002':
+    # Check if the response matches the expected format: C1 00 02 + noise + last
+    if len(response) != 5 or response[:3] != b'\xC1\x00\x02':
         raise ValueError(f"Unexpected RSSI response format: {response.hex()}")
     
-    # Extract RSSI values
-    current_noise_rssi = response[3]
-    last_received_rssi = response[4]
-    
-    current_noise_dbm = - (256 - current_noise_rssi)
-    last_received_dbm = - (256 - last_received_rssi)
+    # Extract RSSI values (dBm = value - 256)
+    current_noise_dbm = response[3] - 256
+    last_received_dbm = response[4] - 256
     
     return {
         "Current Noise RSSI": current_noise_dbm,
@@ -1,24 +1,60 @@
 #!/usr/bin/env python3
 import serial
 import logging
+import queue
 import time
-import subprocess
+import os
+import re
+import selectors
+import socket
+import struct
+from logging.handlers import QueueHandler, QueueListener
 
-# Configure logging to file only
-logging.basicConfig(filename='/tmp/lorain.log', level=logging.INFO, 
-                    format='%(asctime)s - %(message)s', 
-                    datefmt='%Y-%m-%d %H:%M:%S')
+# Configure logging to file only. The RX loop formats each message and
+# enqueues it; a background listener thread adds the timestamp prefix and
+# does the file writes.
+_log_queue = queue.Queue(-1)
+_file_handler = logging.FileHandler('/tmp/lorain.log')
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s',
+                                             datefmt='%Y-%m-%d %H:%M:%S'))
+_log_listener = QueueListener(_log_queue, _file_handler)
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[QueueHandler(_log_queue)])
+
+# Seconds between RSSI queries. Matches the old loop, which queried every 6th
+# iteration of a 1 s read timeout plus a 1 s sleep (~12 s when idle).
+RSSI_INTERVAL = 12
+RSSI_COMMAND = b'\xC0\xC1\xC2\xC3\x00\x02'  # Command to read registers 0x00 and 0x01
+_RSSI_COMMAND_HEX = RSSI_COMMAND.hex().upper()
+GATEWAY_CACHE_TTL = 30  # Seconds to reuse the default gateway lookup
+HEX_DUMP_LIMIT = 64  # Max bytes of an undecodable line written to the log
+
+# Either frame sentinel: 0xC1 starts an RSSI reply, newline ends a text message
+_SENTINEL_RE = re.compile(rb'[\xC1\n]')
+
+_gw_cache = {'ts': None, 'val': "Unknown"}
 
 def get_default_gateway():
+    now = time.monotonic()
+    if _gw_cache['ts'] is not None and now - _gw_cache['ts'] < GATEWAY_CACHE_TTL:
+        return _gw_cache['val']
+
+    gateway = "Unknown"
     try:
-        # Use ip route command to fetch the default gateway
-        result = subprocess.run(['ip', 'route', 'show', 'default'], capture_output=True, text=True, check=True)
-        gateway_line = result.stdout.split('\n')[0]
-        gateway = gateway_line.split()[2]
-        return gateway
-    except subprocess.CalledProcessError:
+        # Read the kernel routing table directly instead of forking 'ip route'
+        with open('/proc/net/route') as f:
+            next(f)  # Skip header
+            for line in f:
+                fields = line.split()
+                # Destination 00000000 is the default route; gateway is little-endian hex
+                if fields[1] == '00000000' and int(fields[3], 16) & 0x2:
+                    gateway = socket.inet_ntoa(struct.pack('<L', int(fields[2], 16)))
+                    break
+    except (OSError, ValueError, IndexError, StopIteration):
         logging.error("Failed to retrieve default gateway")
-        return "Unknown"
+    _gw_cache['ts'] = now
+    _gw_cache['val'] = gateway
+    return gateway
 
 def setup_serial():
     try:
@@ -32,34 +68,34 @@ def setup_serial():
         )
         return ser
     except serial.SerialException as e:
-        logging.error(f"Error opening serial port: {e}")
+        logging.error("Error opening serial port: %s", e)
         return None
 
 def send_rssi_command(ser):
-    # Command to read RSSI as byte sequence
-    rssi_command = b'\xC0\xC1\xC2\xC3\x00\x02'  # Command to read registers 0x00 and 0x01
-    gateway = get_default_gateway()
-    gateway_message = f"Gateway: {gateway}".encode('utf-8')
-    #ser.write(gateway_message + b'\r\n')
-    ser.write(rssi_command)
-    logging.info(f"Sent RSSI query command: {rssi_command.hex().upper()}")
+    ser.write(RSSI_COMMAND)
+    logging.info("Sent RSSI query command: %s", _RSSI_COMMAND_HEX)
 
 def process_rssi_response(response):
-    if not response.startswith(b'\xC1'):
+    if response[0] != 0xC1:
         return None
-    # Expected format: C1 + address + read length + RSSI value
-    rssi_value = response[3]
-    return {
-        "RSSI Value": - (256 - rssi_value)
-    }
+    # Expected format: C1 + address + read length + RSSI value (dBm = value - 256)
+    return response[3] - 256
 
 def send_rssi_back(ser, rssi_value):
     # Send RSSI value back to the sender in ASCII format followed by CRLF
     rssi_response = f"{rssi_value}\r\n".encode('ascii')
     ser.write(rssi_response)
-    logging.info(f"Sent RSSI value back: {rssi_value}")
+    logging.info("Sent RSSI value back: %d", rssi_value)
 
 def main():
+    # Records queued before start() or after stop() would never reach the file
+    _log_listener.start()
+    try:
+        listen()
+    finally:
+        _log_listener.stop()
+
+def listen():
     ser = setup_serial()
     if ser is None:
         logging.info("Failed to open serial port. Exiting.")
@@ -74,50 +110,80 @@ def main():
     # Use a buffer for accumulating message data
     message_buffer = bytearray()
 
+    # Wait on the serial fd itself; the select() timeout doubles as the RSSI timer
+    sel = selectors.DefaultSelector()
+    sel.register(ser.fileno(), selectors.EVENT_READ)
+
     try:
-        i = 0
+        next_rssi = time.monotonic()  # First query right away
         while True:  
             # Read any incoming data which might include UTF-8 messages or RSSI responses
-            normal_data = ser.read(240)  
+            timeout = max(0.0, next_rssi - time.monotonic())
+            if sel.select(timeout):
+                normal_data = os.read(ser.fileno(), 4096)
+                if not normal_data:
+                    # Readable but empty means the USB adapter went away
+                    raise serial.SerialException("device reports readiness to read but returned no data")
+            else:
+                normal_data = b''
             
             if normal_data:
                 message_buffer.extend(normal_data)
+                gateway = get_default_gateway()  # Once per read, not per frame
                 
-                while message_buffer:
-                    if b'\xC1' in message_buffer:
-                        start = message_buffer.find(b'\xC1')
-                        if start + 4 <= len(message_buffer): 
+                # Parse from a read offset and compact once per pass instead of
+                # shifting the buffer after every frame
+                pos = 0
+                while pos < len(message_buffer):
+                    # One scan finds whichever sentinel comes first
+                    match = _SENTINEL_RE.search(message_buffer, pos)
+                    if match is None:
+                        break
+                    start = match.start()
+                    if message_buffer[start] == 0xC1:
+                        if start + 4 <= len(message_buffer):
                             rssi_response = message_buffer[start:start+4]  
-                            rssi_values = process_rssi_response(rssi_response)
-                            if rssi_values:
-                                logging.info(f"RSSI Value: {rssi_values['RSSI Value']} dBm from {get_default_gateway()}")
-                                send_rssi_back(ser, rssi_values['RSSI Value'])
-                            del message_buffer[start:start+4]
+                            rssi_value = process_rssi_response(rssi_response)
+                            if rssi_value is not None:
+                                logging.info("RSSI Value: %d dBm from %s", rssi_value, gateway)
+                                send_rssi_back(ser, rssi_value)
+                            if start == pos:
+                                pos += 4
+                            else:
+                                # Frame interrupted a partial text line; splice it out
+                                del message_buffer[start:start+4]
                         else:
                             break 
                     else:
+                        line = message_buffer[pos:start+1]
                         try:
-                            end_of_message = message_buffer.find(b'\n')
-                            if end_of_message != -1:
-                                decoded_msg = message_buffer[:end_of_message+1].decode('utf-8', errors='ignore').strip()
-                                logging.info(f"Received UTF-8 from {get_default_gateway()}: {decoded_msg}")
-                                del message_buffer[:end_of_message+1]
-                            else:
-                                break
+                            # Plain ASCII lines (the common case) skip UTF-8 validation
+                            decoded_msg = (line.decode('ascii') if line.isascii() else line.decode('utf-8')).strip()
+                            logging.info("Received UTF-8 from %s: %s", gateway, decoded_msg)
                         except UnicodeDecodeError:
-                            logging.info(f"Received non-UTF-8 data (hex) from Gateway {get_default_gateway()}: {message_buffer.hex(' ').upper()}")
-                            message_buffer.clear()
+                            # Keep the whole line readable (bad bytes escaped as \xNN) and
+                            # add the head of the raw bytes as extra detail
+                            logging.info("Received UTF-8 from %s: %s", gateway,
+                                         line.decode('utf-8', errors='backslashreplace').strip())
+                            logging.info("Non-UTF-8 bytes in line from Gateway %s (hex): %s",
+                                         gateway, line[:HEX_DUMP_LIMIT].hex(' ').upper())
+                        pos = start + 1
+                del message_buffer[:pos]
 
-            # Send RSSI command once per minute
-            if i % 6 == 0:  
+            # Send RSSI command every RSSI_INTERVAL seconds
+            now = time.monotonic()
+            if now >= next_rssi:
                 send_rssi_command(ser)
-            
-            i += 1
-            time.sleep(1)  
+                # Advance on a fixed grid so read handling does not skew the cadence;
+                # resync if we fell more than a whole period behind
+                next_rssi += RSSI_INTERVAL
+                if next_rssi <= now:
+                    next_rssi = now + RSSI_INTERVAL
 
     except Exception as e:
-        logging.error(f"An error occurred: {e}")
+        logging.error("An error occurred: %s", e)
     finally:
+        sel.close()
         ser.close()
 
 if __name__ == "__main__":
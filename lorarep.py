@@ -2,8 +2,19 @@
 import paho.mqtt.client as mqtt
 import json
 import base64
+import functools
 import time
 import logging
+import queue
+import socket
+import threading
+
+# Optional: orjson für schnelleres JSON-Parsing/-Serialisieren
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(
@@ -17,93 +28,142 @@ BROKER = "127.0.0.1"          # Da das Skript auf heissa.de läuft
 GATEWAY_ID = "48621185db7c38ca" # Deine ID aus der local_conf.json
 FREQ_HZ = 868100000           # Die Frequenz deines E22 (z.B. 868.1 MHz)
 DR = 5                        # Datenrate (SF7 für EU868)
+WORK_QUEUE_SIZE = 1000        # Max. gepufferte Uplinks, danach wird verworfen
 
 # Topics (ChirpStack MQTT Forwarder Format)
 TOPIC_UP = f"gateway/{GATEWAY_ID}/event/up"
 TOPIC_DOWN = f"gateway/{GATEWAY_ID}/command/down"
 
+# Konstante Log-Fragmente einmalig vorbereiten
+_log = logging.getLogger()
+_FREQ_MHZ_STR = f"{FREQ_HZ/1000000} MHz"
+
+# JSON-Helfer: beide Varianten nehmen bytes an und liefern bytes zurück
+if ORJSON_AVAILABLE:
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+def build_downlink(raw_lora):
+    # Baue den Sendeauftrag (Downlink)
+    # Wir erzwingen die Frequenz, damit der E22 es hört!
+    return {
+        "devEui": "0000000000000000", # Nicht relevant für Forwarder
+        "confirmed": False,
+        "fPort": 1,
+        "data": raw_lora,             # Wir spiegeln die Payload 1:1
+        "timing": {
+            "immediately": {}         # Sofort senden
+        },
+        "txInfo": {
+            "frequency": FREQ_HZ,     # <--- EXAKT DIE E22 FREQUENZ
+            "power": 14,              # Sendeleistung in dBm
+            "modulation": {
+                "lora": {
+                    "bandwidth": 125000,
+                    "spreadingFactor": 7,
+                    "codeRate": "CR_4_5"
+                }
+            }
+        }
+    }
+
+# Bis auf "data" ist der Downlink konstant: einmal serialisieren und
+# pro Paket nur noch die Payload einsetzen
+_DOWNLINK_PREFIX, _DOWNLINK_SUFFIX = json_dumps(build_downlink("__PAYLOAD__")).split(b'"__PAYLOAD__"')
+
+# Wiederholte Payloads (z.B. Testpakete) liefern direkt die fertigen bytes
+@functools.lru_cache(maxsize=64)
+def serialize_downlink(raw_lora):
+    return _DOWNLINK_PREFIX + json_dumps(raw_lora) + _DOWNLINK_SUFFIX
+
 def on_connect(client, userdata, flags, reason_code, properties):
     if reason_code == 0:
         logging.info(f"Verbunden mit Broker (Code {reason_code})")
+        # Kleine Downlinks sofort senden, nicht auf Nagle warten
+        sock = client.socket()
+        if isinstance(sock, socket.socket):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         client.subscribe(TOPIC_UP)
         logging.info(f"Abonniert: {TOPIC_UP}")
     else:
         logging.error(f"Verbindung fehlgeschlagen (Code {reason_code})")
 
+# Uplinks werden im Worker-Thread verarbeitet, damit der MQTT-Netzwerk-Thread
+# nur die Payload einreiht und sofort weiter den Socket leert
+_work_q = queue.Queue(WORK_QUEUE_SIZE)
+
 def on_message(client, userdata, msg):
     try:
-        data = json.loads(msg.payload)
+        _work_q.put_nowait(msg.payload)
+    except queue.Full:
+        _log.warning("Warteschlange voll, Paket verworfen")
+
+def handle_message(client, payload):
+    try:
+        data = json_loads(payload)
 
         # 1. Extrahiere die rohen LoRa-Daten (PhyPayload)
         # ChirpStack sendet diese als Base64
         raw_lora = data.get("phyPayload")
 
         if not raw_lora:
-            logging.warning("Keine phyPayload in Nachricht gefunden")
+            _log.warning("Keine phyPayload in Nachricht gefunden")
             return
 
-        # Safer access to rxInfo data
-        rx_info_list = data.get('rxInfo', [])
-        if not rx_info_list or not isinstance(rx_info_list, list) or len(rx_info_list) == 0:
-            logging.warning("Keine rxInfo Daten verfügbar")
-            rssi = "N/A"
-            snr = "N/A"
-        else:
-            rx_info = rx_info_list[0]
+        # rxInfo ist fast immer eine nicht-leere Liste; Sonderfälle per Exception
+        try:
+            rx_info = data['rxInfo'][0]
             rssi = rx_info.get('rssi', 'N/A')
             snr = rx_info.get('snr', 'N/A')
+        except (KeyError, IndexError, TypeError, AttributeError):
+            _log.warning("Keine rxInfo Daten verfügbar")
+            rssi = "N/A"
+            snr = "N/A"
 
-        logging.info(f"--- Paket empfangen um {time.strftime('%H:%M:%S')} ---")
-        logging.info(f"RSSI: {rssi} | SNR: {snr}")
-
-        # 2. Baue den Sendeauftrag (Downlink)
-        # Wir erzwingen die Frequenz, damit der E22 es hört!
-        downlink = {
-            "devEui": "0000000000000000", # Nicht relevant für Forwarder
-            "confirmed": False,
-            "fPort": 1,
-            "data": raw_lora,             # Wir spiegeln die Payload 1:1
-            "timing": {
-                "immediately": {}         # Sofort senden
-            },
-            "txInfo": {
-                "frequency": FREQ_HZ,     # <--- EXAKT DIE E22 FREQUENZ
-                "power": 14,              # Sendeleistung in dBm
-                "modulation": {
-                    "lora": {
-                        "bandwidth": 125000,
-                        "spreadingFactor": 7,
-                        "codeRate": "CR_4_5"
-                    }
-                }
-            }
-        }
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("--- Paket empfangen um %s ---", time.strftime('%H:%M:%S'))
+            _log.info("RSSI: %s | SNR: %s", rssi, snr)
 
-        # 3. Zurückschicken über den WireGuard-Tunnel
-        client.publish(TOPIC_DOWN, json.dumps(downlink))
-        logging.info(f"Echo gesendet auf {FREQ_HZ/1000000} MHz")
+        # 2. Zurückschicken über den WireGuard-Tunnel
+        client.publish(TOPIC_DOWN, serialize_downlink(raw_lora))
+        _log.info("Echo gesendet auf %s", _FREQ_MHZ_STR)
 
     except json.JSONDecodeError as e:
-        logging.error(f"JSON Decode Fehler: {e}")
+        _log.error("JSON Decode Fehler: %s", e)
     except Exception as e:
-        logging.error(f"Fehler: {e}", exc_info=True)
+        _log.error("Fehler: %s", e, exc_info=True)
 
 def on_disconnect(client, userdata, disconnect_flags, reason_code, properties):
     if reason_code != 0:
         logging.warning(f"Unerwartete Trennung vom Broker (Code {reason_code})")
 
-# MQTT Client Setup
-client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
-client.on_connect = on_connect
-client.on_message = on_message
-client.on_disconnect = on_disconnect
+def worker(client):
+    while True:
+        handle_message(client, _work_q.get())
 
-try:
-    client.connect(BROKER, 1883, 60)
-    logging.info("Starte MQTT Loop...")
-    client.loop_forever()
-except KeyboardInterrupt:
-    logging.info("Beende durch Benutzer...")
-    client.disconnect()
-except Exception as e:
-    logging.error(f"Kritischer Fehler: {e}", exc_info=True)
+def main():
+    # MQTT Client Setup
+    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+    client.on_connect = on_connect
+    client.on_message = on_message
+    client.on_disconnect = on_disconnect
+
+    threading.Thread(target=worker, args=(client,), daemon=True).start()
+
+    try:
+        client.connect(BROKER, 1883, 60)
+        logging.info("Starte MQTT Loop...")
+        client.loop_forever()
+    except KeyboardInterrupt:
+        logging.info("Beende durch Benutzer...")
+        client.disconnect()
+    except Exception as e:
+        logging.error(f"Kritischer Fehler: {e}", exc_info=True)
+
+if __name__ == "__main__":
+    main()
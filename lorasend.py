@@ -15,7 +15,11 @@ import serial
 import logging
 import time
 import argparse
-from datetime import datetime
+import itertools
+
+RSSI_COMMAND = b'\xC0\xC1\xC2\xC3\x00\x02'  # Read registers 0x00 and 0x01
+RSSI_REPLY_LEN = 5  # C1 00 02 + noise RSSI + last RSSI
+E22_BUFFER_SIZE = 1000  # Approx. E22 UART buffer; larger writes overrun it and drop packets
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +33,20 @@ file_handler = logging.FileHandler('/tmp/lorasend.log')
 file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
 logging.getLogger().addHandler(file_handler)
 
+# Timestamp cache: strftime only runs when the wall-clock second changes
+_last_sec = None
+_last_timestamp = ""
+
+
+def current_timestamp():
+    """Return the local time as 'YYYY-MM-DD HH:MM:SS'"""
+    global _last_sec, _last_timestamp
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _last_sec = sec
+    return _last_timestamp
+
 
 class E22Sender:
     """E22 LoRa Module Sender"""
@@ -38,7 +56,9 @@ class E22Sender:
         self.baudrate = baudrate
         self.ser = None
         self.packet_count = 0
+        self._counter = itertools.count(1)  # Source of packet numbers
         self.rssi_enabled = False
+        self._rssi_buf = bytearray(RSSI_REPLY_LEN)  # Reused for every RSSI reply
 
     def setup_serial(self):
         """Initialize serial connection"""
@@ -60,18 +80,16 @@ class E22Sender:
 
     def send_rssi_command(self):
         """Send RSSI query command to E22"""
-        rssi_command = b'\xC0\xC1\xC2\xC3\x00\x02'
-        self.ser.write(rssi_command)
-        logging.debug(f"Sent RSSI query: {rssi_command.hex().upper()}")
-
-        # Wait for response
-        time.sleep(0.1)
-        if self.ser.in_waiting > 0:
-            response = self.ser.read(self.ser.in_waiting)
-            rssi_value = self.process_rssi_response(response)
-            if rssi_value is not None:
-                logging.info(f"Current RSSI: {rssi_value} dBm")
-                return rssi_value
+        self.ser.write(RSSI_COMMAND)
+        logging.debug("Sent RSSI query: %s", RSSI_COMMAND.hex().upper())
+
+        # readinto() returns as soon as the whole reply is in (or after the
+        # port timeout) and fills the preallocated buffer in place
+        n = self.ser.readinto(self._rssi_buf)
+        rssi_value = self.process_rssi_response(memoryview(self._rssi_buf)[:n])
+        if rssi_value is not None:
+            logging.info(f"Current RSSI: {rssi_value} dBm")
+            return rssi_value
         return None
 
     def process_rssi_response(self, response):
@@ -88,17 +106,15 @@ class E22Sender:
             # E22 will transmit it immediately over LoRa
             encoded_msg = message.encode('utf-8')
 
-            # Send the message
+            # Send the message and wait until the UART has drained it
             self.ser.write(encoded_msg)
+            self.ser.flush()
 
-            # Add small delay to ensure transmission
-            time.sleep(0.1)
-
-            self.packet_count += 1
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.packet_count = next(self._counter)
+            timestamp = current_timestamp()[11:]
 
             print(f"[{timestamp}] Sent packet #{self.packet_count}: {message}")
-            logging.info(f"TX Packet #{self.packet_count}: {message} ({len(encoded_msg)} bytes)")
+            logging.info("TX Packet #%d: %s (%d bytes)", self.packet_count, message, len(encoded_msg))
 
             return True
 
@@ -106,6 +122,36 @@ class E22Sender:
             logging.error(f"Error sending packet: {e}")
             return False
 
+    def send_batch(self, messages):
+        """Send several packets back-to-back, in writes that fit the E22 buffer"""
+        try:
+            encoded_msgs = [message.encode('utf-8') for message in messages]
+
+            # Group whole messages into chunks of at most E22_BUFFER_SIZE bytes,
+            # draining the UART after each one
+            chunk = bytearray()
+            for encoded_msg in encoded_msgs:
+                if chunk and len(chunk) + len(encoded_msg) > E22_BUFFER_SIZE:
+                    self.ser.write(chunk)
+                    self.ser.flush()
+                    chunk.clear()
+                chunk += encoded_msg
+            if chunk:
+                self.ser.write(chunk)
+                self.ser.flush()
+
+            timestamp = current_timestamp()[11:]
+            for message, encoded_msg in zip(messages, encoded_msgs):
+                self.packet_count = next(self._counter)
+                print(f"[{timestamp}] Sent packet #{self.packet_count}: {message}")
+                logging.info("TX Packet #%d: %s (%d bytes)", self.packet_count, message, len(encoded_msg))
+
+            return True
+
+        except Exception as e:
+            logging.error(f"Error sending batch: {e}")
+            return False
+
     def run(self, interval=5, message_prefix="TEST", enable_rssi=False):
         """Main send loop"""
         print("=" * 60)
@@ -126,7 +172,7 @@ class E22Sender:
         try:
             while True:
                 # Create message with timestamp
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                timestamp = current_timestamp()
                 message = f"{message_prefix} #{self.packet_count + 1} {timestamp}\n"
 
                 # Send packet
@@ -172,7 +218,8 @@ def main():
         "--interval",
         type=float,
         default=5.0,
-        help="Interval between packets in seconds (default: 5)"
+        help="Interval between packets in seconds (default: 5; 0 with --burst sends back-to-back "
+             "in writes of up to ~1000 bytes, the E22 buffer size)"
     )
     parser.add_argument(
         "--message",
@@ -200,12 +247,17 @@ def main():
             return
 
         print(f"Burst mode: Sending {args.burst} packets...")
-        for i in range(args.burst):
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            message = f"{args.message} #{i + 1} {timestamp}\n"
-            sender.send_packet(message)
-            if i < args.burst - 1:  # Don't wait after last packet
-                time.sleep(args.interval)
+        if args.interval <= 0:
+            # No on-air spacing requested: hand everything to the UART at once
+            timestamp = current_timestamp()
+            sender.send_batch([f"{args.message} #{i + 1} {timestamp}\n" for i in range(args.burst)])
+        else:
+            for i in range(args.burst):
+                timestamp = current_timestamp()
+                message = f"{args.message} #{i + 1} {timestamp}\n"
+                sender.send_packet(message)
+                if i < args.burst - 1:  # Don't wait after last packet
+                    time.sleep(args.interval)
 
         print(f"\nBurst complete. Sent {args.burst} packets.")
         sender.ser.close()
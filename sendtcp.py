@@ -2,7 +2,7 @@
 import socket
 import time
 import logging
-import threading
+import selectors
 from datetime import datetime
 
 # Configure logging
@@ -16,62 +16,81 @@ logging.basicConfig(
 TCP_IP = '192.168.4.101'  # Change this to your device's IP
 TCP_PORT = 8886
 BUFFER_SIZE = 240
+SEND_INTERVAL = 5  # Seconds between HELLO messages / RSSI commands
+
+# Command to read registers 0x00 and 0x01
+#_RSSI_CMD = b"C0C1C2C30001"
+_RSSI_CMD = b'\xC0\xC1\xC2\xC3\x00\x02'
+_RSSI_CMD_HEX = _RSSI_CMD.hex().upper()  # Logged in hex for clarity
+
+# Reused for every recv_into() instead of allocating a new bytes per read
+_rx_buf = bytearray(BUFFER_SIZE)
 
 def send_message(sock, message):
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     full_message = f"{current_time} - {message}"
-    sock.send(full_message.encode() + b'\r\n')  # Append CRLF for proper termination
-    logging.info(f"Sent: {full_message}")  # Log sent message with timestamp
+    data = full_message.encode() + b'\r\n'  # Append CRLF for proper termination
+    sock.sendall(data)
+    logging.info("Sent: %s", full_message)  # Log sent message with timestamp
 
 def send_rssi_command(sock):
     # Send command to read RSSI
-    #rssi_command = b"C0C1C2C30001"  # Command to read registers 0x00 and 0x01
-    rssi_command = b'\xC0\xC1\xC2\xC3\x00\x02'
-    sock.send(rssi_command)
-    logging.info(f"Sent: {rssi_command.hex().upper()}")  # Log in hex for clarity
+    sock.sendall(_RSSI_CMD)
+    logging.info("Sent: %s", _RSSI_CMD_HEX)
 
-def receive_messages(sock):
-    while True:
-        try:
-            incoming = sock.recv(BUFFER_SIZE)
-            if incoming:
-                # Try to interpret incoming data as RSSI response
-                if incoming.startswith(b'\xC1') and len(incoming) >= 4:
-                    # Assuming RSSI is the 4th byte (index 3)
-                    rssi_value = incoming[3]
-                    rssi_dbm = - (256 - rssi_value)
-                    logging.info(f"Received RSSI: {rssi_dbm} dBm")
-                else:
-                    # If it's not an RSSI response, treat it as a regular message
-                    decoded_message = incoming.decode(errors='ignore').strip()
-                    print(f"Received: {decoded_message}")
-                    logging.info(f"Received: {decoded_message}")
-        except Exception as e:
-            logging.error(f"Error receiving message: {e}")
-            break  # Exit the loop if there's an error (like connection lost)
+def receive_message(sock):
+    """Handle one readable event on the socket; returns False once the connection is gone"""
+    try:
+        n = sock.recv_into(_rx_buf)
+    except OSError as e:
+        logging.error(f"Error receiving message: {e}")
+        return False
+    if not n:
+        logging.error("Connection closed by peer")
+        return False
+    # Try to interpret incoming data as RSSI response
+    if n >= 4 and _rx_buf[0] == 0xC1:
+        # Assuming RSSI is the 4th byte (index 3); dBm = value - 256
+        logging.info("Received RSSI: %d dBm", _rx_buf[3] - 256)
+    else:
+        # If it's not an RSSI response, treat it as a regular message
+        decoded_message = _rx_buf[:n].decode(errors='ignore').strip()
+        print(f"Received: {decoded_message}")
+        logging.info("Received: %s", decoded_message)
+    return True
 
 # Create a TCP socket
 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
     s.connect((TCP_IP, TCP_PORT))
-    
-    # Start receiving messages in a separate thread
-    receiver_thread = threading.Thread(target=receive_messages, args=(s,), daemon=True)
-    receiver_thread.start()
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Don't hold small writes back
+
+    # One thread waits on the socket; the select() timeout doubles as the send timer
+    sel = selectors.DefaultSelector()
+    sel.register(s, selectors.EVENT_READ)
 
     # Enable RSSI once at the start, in case it wasn't previously enabled
     send_rssi_command(s)
 
     # Main loop to send messages and RSSI commands
     try:
+        next_send = time.monotonic()
         while True:
-            message = "HELLO world was sent to 192.168.4.101:8886"
-            send_message(s, message)
-            
-            # Send RSSI command every cycle
-            send_rssi_command(s)
-            
-            time.sleep(5)  # Wait for 5 seconds before sending the next message and RSSI command
+            if sel.select(max(0.0, next_send - time.monotonic())):
+                if not receive_message(s):
+                    break  # Exit the loop if there's an error (like connection lost)
+
+            # Checked after every wakeup, so steady incoming data can't postpone the send
+            if time.monotonic() >= next_send:
+                message = "HELLO world was sent to 192.168.4.101:8886"
+                send_message(s, message)
+
+                # Send RSSI command every cycle; as its own write so it starts a UART frame
+                send_rssi_command(s)
+
+                next_send = time.monotonic() + SEND_INTERVAL  # Wait before the next message and RSSI command
     except KeyboardInterrupt:
         logging.info("Interrupted by user. Stopping...")
     except Exception as e:
         logging.error(f"An error occurred: {e}")
+    finally:
+        sel.close()
@@ -13,23 +13,47 @@ Tests cover:
 
 import unittest
 import sys
-from unittest.mock import Mock, MagicMock, patch
+import types
+from unittest.mock import Mock, patch
 
-# Mock the serial module before importing e22
-sys.modules['serial'] = MagicMock()
+# Stub the serial module before importing e22; the tests never open a port,
+# so only the name e22 references needs to exist
+_serial = types.ModuleType('serial')
+_serial.Serial = type('Serial', (), {})
+sys.modules['serial'] = _serial
 
 import e22
 
+# Option sequences indexed by register code, and option -> code maps
+_AIR_RATE_SEQ = ("0.3k", "1.2k", "2.4k", "4.8k", "9.6k", "19.2k", "38.4k", "62.5k")
+_BAUD_RATE_SEQ = ("1200", "2400", "4800", "9600", "19200", "38400", "57600", "115200")
+_PARITY_SEQ = ("8N1", "8O1", "8E1", "8N1")  # Note: code 3 also maps to 8N1
+_POWER_SEQ = ("13dBm", "18dBm", "22dBm", "27dBm")
+_PARITY_MAP = types.MappingProxyType({"8N1": 0, "8O1": 1, "8E1": 2})
+_POWER_MAP = types.MappingProxyType({"13dBm": 0, "18dBm": 1, "22dBm": 2, "27dBm": 3})
+
+# Default register image: REG1=0xE0, REG3=0x80, everything else zero
+_BASE_CFG = bytes((0x00, 0x00, 0x00, 0x00, 0xE0, 0x00, 0x80, 0x00, 0x00))
+
+
+def _config_with(index, value):
+    """Return a copy of _BASE_CFG with one register byte replaced."""
+    config = bytearray(_BASE_CFG)
+    config[index] = value
+    return config
+
 
 class TestParseConfig(unittest.TestCase):
     """Test suite for the parse_config() function."""
 
+    parse_config = staticmethod(e22.parse_config)
+
     def test_parse_basic_config(self):
         """Test parsing a basic configuration."""
         # Config: Address=0x1234, NetAddr=0x00, Channel=21,
         # AirRate=2.4k(2), BaudRate=9600(3), Parity=8N1(0), Power=22dBm(2)
-        config = [0x12, 0x34, 0x00, 0x62, 0xE2, 0x15, 0x80, 0x00, 0x00]
-        result = e22.parse_config(config)
+        config = bytes((0x12, 0x34, 0x00, 0x62, 0xE2, 0x15, 0x80, 0x00, 0x00))
+        result = self.parse_config(config)
 
         self.assertEqual(result["Address"], "0x1234")
         self.assertEqual(result["Network Address"], "0x00")
@@ -41,124 +65,116 @@ class TestParseConfig(unittest.TestCase):
 
     def test_parse_all_air_rates(self):
         """Test parsing all possible air rate values."""
-        air_rates = ["0.3k", "1.2k", "2.4k", "4.8k", "9.6k", "19.2k", "38.4k", "62.5k"]
-
-        for i, expected_rate in enumerate(air_rates):
-            config = [0x00, 0x00, 0x00, i, 0xE0, 0x00, 0x80, 0x00, 0x00]
-            result = e22.parse_config(config)
+        for i, expected_rate in enumerate(_AIR_RATE_SEQ):
+            config = bytes((0x00, 0x00, 0x00, i, 0xE0, 0x00, 0x80, 0x00, 0x00))
+            result = self.parse_config(config)
             self.assertEqual(result["Air Rate"], expected_rate,
                            f"Failed for air rate code {i}")
 
     def test_parse_all_baud_rates(self):
         """Test parsing all possible baud rate values."""
-        baud_rates = ["1200", "2400", "4800", "9600", "19200", "38400", "57600", "115200"]
-
-        for i, expected_baud in enumerate(baud_rates):
-            config = [0x00, 0x00, 0x00, i << 5, 0xE0, 0x00, 0x80, 0x00, 0x00]
-            result = e22.parse_config(config)
+        for i, expected_baud in enumerate(_BAUD_RATE_SEQ):
+            config = bytes((0x00, 0x00, 0x00, i << 5, 0xE0, 0x00, 0x80, 0x00, 0x00))
+            result = self.parse_config(config)
             self.assertEqual(result["Baud Rate"], expected_baud,
                            f"Failed for baud rate code {i}")
 
     def test_parse_all_parity_modes(self):
         """Test parsing all possible parity modes."""
-        parities = ["8N1", "8O1", "8E1", "8N1"]  # Note: code 3 also maps to 8N1
-
-        for i, expected_parity in enumerate(parities):
-            config = [0x00, 0x00, 0x00, i << 3, 0xE0, 0x00, 0x80, 0x00, 0x00]
-            result = e22.parse_config(config)
+        for i, expected_parity in enumerate(_PARITY_SEQ):
+            config = bytes((0x00, 0x00, 0x00, i << 3, 0xE0, 0x00, 0x80, 0x00, 0x00))
+            result = self.parse_config(config)
             self.assertEqual(result["Parity"], expected_parity,
                            f"Failed for parity code {i}")
 
     def test_parse_all_power_levels(self):
         """Test parsing all possible transmitting power levels."""
-        powers = ["13dBm", "18dBm", "22dBm", "27dBm"]
-
-        for i, expected_power in enumerate(powers):
-            config = [0x00, 0x00, 0x00, 0x00, 0xE0 | i, 0x00, 0x80, 0x00, 0x00]
-            result = e22.parse_config(config)
+        for i, expected_power in enumerate(_POWER_SEQ):
+            config = bytes((0x00, 0x00, 0x00, 0x00, 0xE0 | i, 0x00, 0x80, 0x00, 0x00))
+            result = self.parse_config(config)
             self.assertEqual(result["Transmitting Power"], expected_power,
                            f"Failed for power code {i}")
 
     def test_parse_fixed_transmission_enabled(self):
         """Test parsing with fixed-point transmission enabled."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xE0, 0x00, 0xC0, 0x00, 0x00]  # REG3 bit 6 set
-        result = e22.parse_config(config)
+        config = _config_with(6, 0xC0)  # REG3 bit 6 set
+        result = self.parse_config(config)
         self.assertEqual(result["Fixed Transmission"], "Fixed-point")
 
     def test_parse_fixed_transmission_disabled(self):
         """Test parsing with transparent transmission mode."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xE0, 0x00, 0x80, 0x00, 0x00]  # REG3 bit 6 clear
-        result = e22.parse_config(config)
+        config = _BASE_CFG  # REG3 bit 6 clear
+        result = self.parse_config(config)
         self.assertEqual(result["Fixed Transmission"], "Transparent")
 
     def test_parse_relay_function_enabled(self):
         """Test parsing with relay function enabled."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xE0, 0x00, 0xA0, 0x00, 0x00]  # REG3 bit 5 set
-        result = e22.parse_config(config)
+        config = _config_with(6, 0xA0)  # REG3 bit 5 set
+        result = self.parse_config(config)
         self.assertEqual(result["Relay Function"], "Enabled")
 
     def test_parse_relay_function_disabled(self):
         """Test parsing with relay function disabled."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xE0, 0x00, 0x80, 0x00, 0x00]  # REG3 bit 5 clear
-        result = e22.parse_config(config)
+        config = _BASE_CFG  # REG3 bit 5 clear
+        result = self.parse_config(config)
         self.assertEqual(result["Relay Function"], "Disabled")
 
     def test_parse_lbt_enabled(self):
         """Test parsing with LBT (Listen Before Talk) enabled."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xE0, 0x00, 0x90, 0x00, 0x00]  # REG3 bit 4 set
-        result = e22.parse_config(config)
+        config = _config_with(6, 0x90)  # REG3 bit 4 set
+        result = self.parse_config(config)
         self.assertEqual(result["LBT Enable"], "Enabled")
 
     def test_parse_lbt_disabled(self):
         """Test parsing with LBT disabled."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xE0, 0x00, 0x80, 0x00, 0x00]  # REG3 bit 4 clear
-        result = e22.parse_config(config)
+        config = _BASE_CFG  # REG3 bit 4 clear
+        result = self.parse_config(config)
         self.assertEqual(result["LBT Enable"], "Disabled")
 
     def test_parse_rssi_enabled(self):
         """Test parsing with RSSI enabled."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xE0 | 0x20, 0x00, 0x80, 0x00, 0x00]  # REG1 bit 5 set
-        result = e22.parse_config(config)
+        config = _config_with(4, 0xE0 | 0x20)  # REG1 bit 5 set
+        result = self.parse_config(config)
         self.assertEqual(result["RSSI Enable"], "Enabled")
 
     def test_parse_rssi_disabled(self):
         """Test parsing with RSSI disabled."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xC0, 0x00, 0x80, 0x00, 0x00]  # REG1 bit 5 clear (0xC0 = 0b11000000)
-        result = e22.parse_config(config)
+        config = _config_with(4, 0xC0)  # REG1 bit 5 clear (0xC0 = 0b11000000)
+        result = self.parse_config(config)
         self.assertEqual(result["RSSI Enable"], "Disabled")
 
     def test_parse_noise_enabled(self):
         """Test parsing with noise measurement enabled."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xE0, 0x00, 0x80, 0x00, 0x00]  # REG3 bit 7 set (0x80)
-        result = e22.parse_config(config)
+        config = _BASE_CFG  # REG3 bit 7 set (0x80)
+        result = self.parse_config(config)
         self.assertEqual(result["Noise Enable"], "Enabled")
 
     def test_parse_noise_disabled(self):
         """Test parsing with noise measurement disabled."""
-        config = [0x00, 0x00, 0x00, 0x00, 0xE0, 0x00, 0x00, 0x00, 0x00]  # REG3 bit 7 clear
-        result = e22.parse_config(config)
+        config = _config_with(6, 0x00)  # REG3 bit 7 clear
+        result = self.parse_config(config)
         self.assertEqual(result["Noise Enable"], "Disabled")
 
     def test_parse_max_address(self):
         """Test parsing maximum address value."""
-        config = [0xFF, 0xFF, 0xFF, 0x00, 0xE0, 0x00, 0x80, 0x00, 0x00]
-        result = e22.parse_config(config)
+        config = bytes((0xFF, 0xFF, 0xFF, 0x00, 0xE0, 0x00, 0x80, 0x00, 0x00))
+        result = self.parse_config(config)
         self.assertEqual(result["Address"], "0xFFFF")
         self.assertEqual(result["Network Address"], "0xFF")
 
     def test_parse_all_channels(self):
         """Test parsing various channel values."""
         for channel in [0, 21, 42, 83]:
-            config = [0x00, 0x00, 0x00, 0x00, 0xE0, channel, 0x80, 0x00, 0x00]
-            result = e22.parse_config(config)
+            config = bytes((0x00, 0x00, 0x00, 0x00, 0xE0, channel, 0x80, 0x00, 0x00))
+            result = self.parse_config(config)
             self.assertEqual(result["Channel"], channel)
 
     def test_parse_complex_configuration(self):
         """Test parsing a complex real-world configuration."""
         # Address=0xABCD, NetAddr=0x12, Channel=50, AirRate=19.2k,
         # BaudRate=115200, Parity=8E1, Power=27dBm, All features enabled
-        config = [0xAB, 0xCD, 0x12, 0xF5, 0xE3, 0x32, 0xF0, 0x00, 0x00]
-        result = e22.parse_config(config)
+        config = bytes((0xAB, 0xCD, 0x12, 0xF5, 0xE3, 0x32, 0xF0, 0x00, 0x00))
+        result = self.parse_config(config)
 
         self.assertEqual(result["Address"], "0xABCD")
         self.assertEqual(result["Network Address"], "0x12")
@@ -172,9 +188,11 @@ class TestParseConfig(unittest.TestCase):
 class TestCreateConfig(unittest.TestCase):
     """Test suite for the create_config() function."""
 
+    create_config = staticmethod(e22.create_config)
+
     def test_create_basic_config(self):
         """Test creating a basic configuration."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0x1234,
             network_address=0x00,
             channel=21,
@@ -197,10 +215,8 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_all_air_rates(self):
         """Test creating configs with all air rate options."""
-        air_rates = ["0.3k", "1.2k", "2.4k", "4.8k", "9.6k", "19.2k", "38.4k", "62.5k"]
-
-        for i, air_rate in enumerate(air_rates):
-            config = e22.create_config(
+        for i, air_rate in enumerate(_AIR_RATE_SEQ):
+            config = self.create_config(
                 address=0, network_address=0, channel=0,
                 air_rate=air_rate, baud_rate="9600", parity="8N1",
                 power="13dBm", fixed_transmission="0", relay_function="0",
@@ -210,10 +226,8 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_all_baud_rates(self):
         """Test creating configs with all baud rate options."""
-        baud_rates = ["1200", "2400", "4800", "9600", "19200", "38400", "57600", "115200"]
-
-        for i, baud_rate in enumerate(baud_rates):
-            config = e22.create_config(
+        for i, baud_rate in enumerate(_BAUD_RATE_SEQ):
+            config = self.create_config(
                 address=0, network_address=0, channel=0,
                 air_rate="2.4k", baud_rate=baud_rate, parity="8N1",
                 power="13dBm", fixed_transmission="0", relay_function="0",
@@ -223,10 +237,8 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_all_parities(self):
         """Test creating configs with all parity options."""
-        parities = {"8N1": 0, "8O1": 1, "8E1": 2}
-
-        for parity, expected_code in parities.items():
-            config = e22.create_config(
+        for parity, expected_code in _PARITY_MAP.items():
+            config = self.create_config(
                 address=0, network_address=0, channel=0,
                 air_rate="2.4k", baud_rate="9600", parity=parity,
                 power="13dBm", fixed_transmission="0", relay_function="0",
@@ -236,10 +248,8 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_all_power_levels(self):
         """Test creating configs with all power levels."""
-        powers = {"13dBm": 0, "18dBm": 1, "22dBm": 2, "27dBm": 3}
-
-        for power, expected_code in powers.items():
-            config = e22.create_config(
+        for power, expected_code in _POWER_MAP.items():
+            config = self.create_config(
                 address=0, network_address=0, channel=0,
                 air_rate="2.4k", baud_rate="9600", parity="8N1",
                 power=power, fixed_transmission="0", relay_function="0",
@@ -249,7 +259,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_fixed_transmission_enabled(self):
         """Test creating config with fixed transmission enabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="1", relay_function="0",
@@ -259,7 +269,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_fixed_transmission_disabled(self):
         """Test creating config with transparent mode."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -269,7 +279,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_relay_function_enabled(self):
         """Test creating config with relay function enabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="1",
@@ -279,7 +289,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_relay_function_disabled(self):
         """Test creating config with relay function disabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -289,7 +299,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_lbt_enabled(self):
         """Test creating config with LBT enabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -299,7 +309,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_lbt_disabled(self):
         """Test creating config with LBT disabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -309,7 +319,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_rssi_enabled(self):
         """Test creating config with RSSI enabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -319,7 +329,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_rssi_disabled(self):
         """Test creating config with RSSI disabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -329,7 +339,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_noise_enabled(self):
         """Test creating config with noise measurement enabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -339,7 +349,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_noise_disabled(self):
         """Test creating config with noise measurement disabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -350,7 +360,7 @@ class TestCreateConfig(unittest.TestCase):
     def test_create_address_boundaries(self):
         """Test creating configs with boundary address values."""
         # Minimum address
-        config = e22.create_config(
+        config = self.create_config(
             address=0x0000, network_address=0x00, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -360,7 +370,7 @@ class TestCreateConfig(unittest.TestCase):
         self.assertEqual(config[1], 0x00)
 
         # Maximum address
-        config = e22.create_config(
+        config = self.create_config(
             address=0xFFFF, network_address=0xFF, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -372,7 +382,7 @@ class TestCreateConfig(unittest.TestCase):
 
     def test_create_all_features_enabled(self):
         """Test creating config with all features enabled."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0xABCD, network_address=0x12, channel=50,
             air_rate="19.2k", baud_rate="115200", parity="8E1",
             power="27dBm", fixed_transmission="1", relay_function="1",
@@ -383,16 +393,16 @@ class TestCreateConfig(unittest.TestCase):
         self.assertEqual(config[0], 0xAB)
         self.assertEqual(config[1], 0xCD)
         self.assertEqual(config[2], 0x12)
-        self.assertTrue(config[6] & 0x80)  # Noise
-        self.assertTrue(config[6] & 0x40)  # Fixed transmission
-        self.assertTrue(config[6] & 0x20)  # Relay
-        self.assertTrue(config[6] & 0x10)  # LBT
-        self.assertTrue(config[4] & 0x20)  # RSSI
+        self.assertEqual(config[6] & 0xF0, 0xF0)  # Noise, fixed transmission, relay, LBT
+        self.assertEqual(config[4] & 0x20, 0x20)  # RSSI
 
 
 class TestRoundTripConversion(unittest.TestCase):
     """Test round-trip conversion: create_config -> parse_config."""
 
+    create_config = staticmethod(e22.create_config)
+    parse_config = staticmethod(e22.parse_config)
+
     def test_roundtrip_basic(self):
         """Test basic round-trip conversion."""
         original_params = {
@@ -410,8 +420,8 @@ class TestRoundTripConversion(unittest.TestCase):
             "noise_enable": "0"
         }
 
-        config = e22.create_config(**original_params)
-        parsed = e22.parse_config(config)
+        config = self.create_config(**original_params)
+        parsed = self.parse_config(config)
 
         self.assertEqual(parsed["Address"], f"0x{original_params['address']:04X}")
         self.assertEqual(parsed["Network Address"], f"0x{original_params['network_address']:02X}")
@@ -443,8 +453,8 @@ class TestRoundTripConversion(unittest.TestCase):
             "noise_enable": "1"
         }
 
-        config = e22.create_config(**original_params)
-        parsed = e22.parse_config(config)
+        config = self.create_config(**original_params)
+        parsed = self.parse_config(config)
 
         self.assertEqual(parsed["Address"], "0xABCD")
         self.assertEqual(parsed["Network Address"], "0x12")
@@ -471,15 +481,20 @@ class TestRoundTripConversion(unittest.TestCase):
             ("62.5k", "115200", "8N1", "27dBm"),
         ]
 
+        # Parameters shared by every case
+        base_kwargs = {
+            "address": 0x0001, "network_address": 0x00, "channel": 10,
+            "fixed_transmission": "0", "relay_function": "0",
+            "lbt_enable": "0", "rssi_enable": "0", "noise_enable": "0"
+        }
+
         for air_rate, baud_rate, parity, power in test_cases:
             with self.subTest(air_rate=air_rate, baud_rate=baud_rate):
-                config = e22.create_config(
-                    address=0x0001, network_address=0x00, channel=10,
-                    air_rate=air_rate, baud_rate=baud_rate, parity=parity,
-                    power=power, fixed_transmission="0", relay_function="0",
-                    lbt_enable="0", rssi_enable="0", noise_enable="0"
+                config = self.create_config(
+                    **base_kwargs,
+                    air_rate=air_rate, baud_rate=baud_rate, parity=parity, power=power
                 )
-                parsed = e22.parse_config(config)
+                parsed = self.parse_config(config)
 
                 self.assertEqual(parsed["Air Rate"], air_rate)
                 self.assertEqual(parsed["Baud Rate"], baud_rate)
@@ -487,92 +502,51 @@ class TestRoundTripConversion(unittest.TestCase):
                 self.assertEqual(parsed["Transmitting Power"], power)
 
 
+@patch.object(e22, 'send_command')
 class TestReadRSSI(unittest.TestCase):
     """Test suite for the read_rssi() function."""
 
-    @patch('e22.send_command')
-    def test_rssi_conversion_zero(self, mock_send):
-        """Test RSSI conversion with zero values."""
-        # Mock response: header (3 bytes) + noise=0 + last_rssi=0
-        mock_send.return_value = bytes([0xC1, 0x00, 0x02, 0x00, 0x00])
-
-        ser_mock = Mock()
-        result = e22.read_rssi(ser_mock)
-
-        # RSSI calculation: -(256 - 0) = -256 dBm
-        self.assertEqual(result["Current Noise RSSI"], -256)
-        self.assertEqual(result["Last Received RSSI"], -256)
-
-    @patch('e22.send_command')
-    def test_rssi_conversion_typical(self, mock_send):
-        """Test RSSI conversion with typical values."""
-        # Mock response: noise=200 (-56dBm), last_rssi=180 (-76dBm)
-        mock_send.return_value = bytes([0xC1, 0x00, 0x02, 200, 180])
-
-        ser_mock = Mock()
-        result = e22.read_rssi(ser_mock)
-
-        # RSSI calculation: -(256 - value)
-        self.assertEqual(result["Current Noise RSSI"], -56)
-        self.assertEqual(result["Last Received RSSI"], -76)
+    def setUp(self):
+        self.ser_mock = Mock()
 
-    @patch('e22.send_command')
-    def test_rssi_conversion_strong_signal(self, mock_send):
-        """Test RSSI conversion with strong signal."""
-        # Mock response: noise=240 (-16dBm), last_rssi=230 (-26dBm)
-        mock_send.return_value = bytes([0xC1, 0x00, 0x02, 240, 230])
+    # (noise byte, last byte, expected noise dBm, expected last dBm); dBm = value - 256
+    CONVERSION_CASES = (
+        (0, 0, -256, -256),       # Zero values
+        (200, 180, -56, -76),     # Typical values
+        (240, 230, -16, -26),     # Strong signal
+        (100, 80, -156, -176),    # Weak signal
+        (255, 255, -1, -1),       # Maximum value
+    )
 
-        ser_mock = Mock()
-        result = e22.read_rssi(ser_mock)
+    def test_rssi_conversions(self, mock_send):
+        """Test RSSI conversion across the value range."""
+        for noise, last, expected_noise, expected_last in self.CONVERSION_CASES:
+            with self.subTest(noise=noise, last=last):
+                # Mock response: header (3 bytes) + noise + last_rssi
+                mock_send.return_value = bytes([0xC1, 0x00, 0x02, noise, last])
 
-        self.assertEqual(result["Current Noise RSSI"], -16)
-        self.assertEqual(result["Last Received RSSI"], -26)
+                result = e22.read_rssi(self.ser_mock)
 
-    @patch('e22.send_command')
-    def test_rssi_conversion_weak_signal(self, mock_send):
-        """Test RSSI conversion with weak signal."""
-        # Mock response: noise=100 (-156dBm), last_rssi=80 (-176dBm)
-        mock_send.return_value = bytes([0xC1, 0x00, 0x02, 100, 80])
+                self.assertEqual(result["Current Noise RSSI"], expected_noise)
+                self.assertEqual(result["Last Received RSSI"], expected_last)
 
-        ser_mock = Mock()
-        result = e22.read_rssi(ser_mock)
-
-        self.assertEqual(result["Current Noise RSSI"], -156)
-        self.assertEqual(result["Last Received RSSI"], -176)
-
-    @patch('e22.send_command')
-    def test_rssi_conversion_max_value(self, mock_send):
-        """Test RSSI conversion with maximum value."""
-        # Mock response: noise=255 (-1dBm), last_rssi=255 (-1dBm)
-        mock_send.return_value = bytes([0xC1, 0x00, 0x02, 255, 255])
-
-        ser_mock = Mock()
-        result = e22.read_rssi(ser_mock)
-
-        self.assertEqual(result["Current Noise RSSI"], -1)
-        self.assertEqual(result["Last Received RSSI"], -1)
-
-    @patch('e22.send_command')
     def test_rssi_invalid_response_length(self, mock_send):
         """Test RSSI with invalid response length."""
         # Mock response with wrong length
         mock_send.return_value = bytes([0xC1, 0x00, 0x02])
 
-        ser_mock = Mock()
         with self.assertRaises(ValueError) as context:
-            e22.read_rssi(ser_mock)
+            e22.read_rssi(self.ser_mock)
 
         self.assertIn("Unexpected RSSI response format", str(context.exception))
 
-    @patch('e22.send_command')
     def test_rssi_invalid_response_header(self, mock_send):
         """Test RSSI with invalid response header."""
         # Mock response with wrong header
         mock_send.return_value = bytes([0xFF, 0xFF, 0xFF, 200, 180])
 
-        ser_mock = Mock()
         with self.assertRaises(ValueError) as context:
-            e22.read_rssi(ser_mock)
+            e22.read_rssi(self.ser_mock)
 
         self.assertIn("Unexpected RSSI response format", str(context.exception))
 
@@ -580,20 +554,23 @@ class TestReadRSSI(unittest.TestCase):
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and error conditions."""
 
+    create_config = staticmethod(e22.create_config)
+    parse_config = staticmethod(e22.parse_config)
+
     def test_parse_config_invalid_length(self):
         """Test parsing with invalid config length."""
         # parse_config expects exactly 9 bytes
-        short_config = [0x00, 0x00, 0x00]
+        short_config = bytes((0x00, 0x00, 0x00))
 
         # This should raise an error during unpacking
         with self.assertRaises(ValueError):
-            e22.parse_config(short_config)
+            self.parse_config(short_config)
 
     def test_parse_config_air_rate_masking(self):
         """Test that air rate code masking works correctly."""
         # Air rate uses only 3 bits (mask 0x07), so 0x08 becomes 0x00 after masking
-        config = [0x00, 0x00, 0x00, 0x08, 0xE0, 0x00, 0x80, 0x00, 0x00]
-        result = e22.parse_config(config)
+        config = bytes((0x00, 0x00, 0x00, 0x08, 0xE0, 0x00, 0x80, 0x00, 0x00))
+        result = self.parse_config(config)
         # 0x08 & 0x07 = 0x00, which maps to "0.3k"
         self.assertEqual(result["Air Rate"], "0.3k")
 
@@ -601,8 +578,8 @@ class TestEdgeCases(unittest.TestCase):
         """Test parsing with out-of-range baud rate code."""
         # Baud rate code 8 is out of range (valid: 0-7)
         # Note: This can't happen with 3 bits, but test the bounds check
-        config = [0x00, 0x00, 0x00, 0xFF, 0xE0, 0x00, 0x80, 0x00, 0x00]
-        result = e22.parse_config(config)
+        config = bytes((0x00, 0x00, 0x00, 0xFF, 0xE0, 0x00, 0x80, 0x00, 0x00))
+        result = self.parse_config(config)
         # Should handle gracefully
         self.assertIsNotNone(result["Baud Rate"])
 
@@ -610,7 +587,7 @@ class TestEdgeCases(unittest.TestCase):
         """Test creating config with channel boundary values."""
         # Valid channels: 0-83
         for channel in [0, 1, 41, 82, 83]:
-            config = e22.create_config(
+            config = self.create_config(
                 address=0, network_address=0, channel=channel,
                 air_rate="2.4k", baud_rate="9600", parity="8N1",
                 power="13dBm", fixed_transmission="0", relay_function="0",
@@ -620,7 +597,7 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_create_config_default_noise_enable(self):
         """Test that noise_enable defaults to '0' when not provided."""
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm", fixed_transmission="0", relay_function="0",
@@ -637,10 +614,12 @@ class TestEdgeCases(unittest.TestCase):
 class TestBitFieldManipulation(unittest.TestCase):
     """Test bit-field manipulation correctness."""
 
+    create_config = staticmethod(e22.create_config)
+
     def test_reg0_bit_fields(self):
         """Test REG0 bit field packing and unpacking."""
         # REG0 format: [7:5]=baud, [4:3]=parity, [2:0]=air_rate
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="4.8k",      # code 3 -> bits [2:0] = 011
             baud_rate="57600",    # code 6 -> bits [7:5] = 110
@@ -658,7 +637,7 @@ class TestBitFieldManipulation(unittest.TestCase):
     def test_reg1_bit_fields(self):
         """Test REG1 bit field packing."""
         # REG1 format: base=0xE0, bit 5=RSSI, bits [1:0]=power
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="27dBm",        # code 3
@@ -675,7 +654,7 @@ class TestBitFieldManipulation(unittest.TestCase):
     def test_reg3_bit_fields(self):
         """Test REG3 bit field packing."""
         # REG3 format: bit 7=noise, bit 6=fixed, bit 5=relay, bit 4=lbt
-        config = e22.create_config(
+        config = self.create_config(
             address=0, network_address=0, channel=0,
             air_rate="2.4k", baud_rate="9600", parity="8N1",
             power="13dBm",
@@ -688,30 +667,16 @@ class TestBitFieldManipulation(unittest.TestCase):
 
         reg3 = config[6]
         # Expected: 0x80 | 0x40 | 0x20 | 0x10 = 0xF0
-        self.assertTrue(reg3 & 0x80, "Noise bit should be set")
-        self.assertTrue(reg3 & 0x40, "Fixed transmission bit should be set")
-        self.assertTrue(reg3 & 0x20, "Relay bit should be set")
-        self.assertTrue(reg3 & 0x10, "LBT bit should be set")
+        self.assertEqual(reg3 & 0xF0, 0xF0, "REG3 upper nibble should be 0xF0")
         self.assertEqual(reg3, 0xF0, "REG3 should be 0xF0")
 
 
 def run_tests():
     """Run all tests and print results."""
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestParseConfig))
-    suite.addTests(loader.loadTestsFromTestCase(TestCreateConfig))
-    suite.addTests(loader.loadTestsFromTestCase(TestRoundTripConversion))
-    suite.addTests(loader.loadTestsFromTestCase(TestReadRSSI))
-    suite.addTests(loader.loadTestsFromTestCase(TestEdgeCases))
-    suite.addTests(loader.loadTestsFromTestCase(TestBitFieldManipulation))
-
-    # Run tests with verbose output
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    # Run every TestCase in this module with verbose output; test stdout/stderr
+    # is only shown on failure. argv is fixed so run_tests() always runs all tests.
+    result = unittest.main(module=__name__, argv=sys.argv[:1], exit=False,
+                           verbosity=2, buffer=True).result
 
     # Print summary
     print("\n" + "="*70)
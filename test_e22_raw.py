@@ -1,12 +1,36 @@
 #!/usr/bin/env python3
 """Test E22 communication at low level"""
+import io
 import serial
+import struct
 import time
 import sys
 
 port = '/dev/ttyUSB0'
 baudrate = 9600
 
+# Frequency code reported in the version response
+FREQ_MAP = {
+    0x32: '433MHz',
+    0x38: '470MHz',
+    0x45: '868MHz',
+    0x44: '915MHz',
+    0x46: '170MHz'
+}
+
+# Test output is collected here and written in one go per section
+_out = io.StringIO()
+
+def out(line=""):
+    _out.write(line)
+    _out.write("\n")
+
+def flush_out():
+    sys.stdout.write(_out.getvalue())
+    sys.stdout.flush()
+    _out.seek(0)
+    _out.truncate()
+
 print("=" * 70)
 print("E22 RAW COMMUNICATION TEST")
 print("=" * 70)
@@ -19,100 +43,104 @@ print("=" * 70)
 print()
 
 try:
-    ser = serial.Serial(port, baudrate, timeout=2)
+    ser = serial.Serial(port, baudrate, timeout=0.3)  # Upper bound per read
     time.sleep(0.2)
     ser.reset_input_buffer()
 
-    print(f"✓ Connected to {port} at {baudrate} baud")
-    print()
+    out(f"✓ Connected to {port} at {baudrate} baud")
+    out()
 
     # Test 1: Read Configuration (C1)
-    print("Test 1: Read Configuration (0xC1 0x00 0x09)")
-    print("-" * 70)
+    out("Test 1: Read Configuration (0xC1 0x00 0x09)")
+    out("-" * 70)
     cmd = bytes([0xC1, 0x00, 0x09])
-    print(f"TX: {cmd.hex(' ').upper()}")
+    out(f"TX: {cmd.hex(' ').upper()}")
     ser.write(cmd)
-    time.sleep(0.3)
 
-    response = ser.read(100)
-    print(f"RX: {response.hex(' ').upper()}")
-    print(f"RX Length: {len(response)} bytes")
+    # C1 00 09 + 9 config bytes; read() returns as soon as all 12 are in
+    response = ser.read(12)
+    out(f"RX: {response.hex(' ').upper()}")
+    out(f"RX Length: {len(response)} bytes")
 
     if len(response) >= 12:
-        print("✓ Valid config response!")
-        print(f"  ADDH:  0x{response[3]:02X}")
-        print(f"  ADDL:  0x{response[4]:02X}")
-        print(f"  NETID: 0x{response[5]:02X}")
-        print(f"  REG0:  0x{response[6]:02X}")
-        print(f"  REG1:  0x{response[7]:02X}")
-        print(f"  REG2:  0x{response[8]:02X}")
-        print(f"  REG3:  0x{response[9]:02X}")
+        out("✓ Valid config response!")
+        addh, addl, netid, reg0, reg1, reg2, reg3 = struct.unpack_from('>7B', response, 3)
+        out(f"  ADDH:  0x{addh:02X}")
+        out(f"  ADDL:  0x{addl:02X}")
+        out(f"  NETID: 0x{netid:02X}")
+        out(f"  REG0:  0x{reg0:02X}")
+        out(f"  REG1:  0x{reg1:02X}")
+        out(f"  REG2:  0x{reg2:02X}")
+        out(f"  REG3:  0x{reg3:02X}")
     else:
-        print("✗ Invalid or no response")
+        out("✗ Invalid or no response")
         if len(response) > 0:
-            print("  Possible issues:")
-            print("  - Module not in Config Mode (check M0/M1 pins)")
-            print("  - Wrong baudrate")
-            print("  - Wrong module type")
+            out("  Possible issues:")
+            out("  - Module not in Config Mode (check M0/M1 pins)")
+            out("  - Wrong baudrate")
+            out("  - Wrong module type")
 
-    print()
+    out()
+    flush_out()  # Show test 1 before waiting
     time.sleep(0.5)
     ser.reset_input_buffer()
 
     # Test 2: Read Version (C3)
-    print("Test 2: Read Version (0xC3 0x00 0x00)")
-    print("-" * 70)
+    out("Test 2: Read Version (0xC3 0x00 0x00)")
+    out("-" * 70)
     cmd = bytes([0xC3, 0x00, 0x00])
-    print(f"TX: {cmd.hex(' ').upper()}")
+    out(f"TX: {cmd.hex(' ').upper()}")
     ser.write(cmd)
-    time.sleep(0.3)
 
-    response = ser.read(100)
-    print(f"RX: {response.hex(' ').upper()}")
-    print(f"RX Length: {len(response)} bytes")
+    # Reply length varies by firmware; keep reading until the 0.3 s timeout passes in silence
+    response = ser.read(5)
+    while True:
+        chunk = ser.read(64)
+        if not chunk:
+            break
+        response += chunk
+    out(f"RX: {response.hex(' ').upper()}")
+    out(f"RX Length: {len(response)} bytes")
 
     if len(response) >= 4 and response[0] == 0xC1:
-        print("✓ Valid version response!")
-        freq_map = {
-            0x32: '433MHz',
-            0x38: '470MHz',
-            0x45: '868MHz',
-            0x44: '915MHz',
-            0x46: '170MHz'
-        }
+        out("✓ Valid version response!")
         if len(response) >= 5:
-            freq = freq_map.get(response[4], f'Unknown (0x{response[4]:02X})')
-            print(f"  Frequency: {freq}")
+            freq = FREQ_MAP.get(response[4], f'Unknown (0x{response[4]:02X})')
+            out(f"  Frequency: {freq}")
     else:
-        print("✗ Invalid version response")
+        out("✗ Invalid version response")
         if response[:3] == cmd:
-            print("  ⚠ Module is ECHOING the command!")
-            print("  ⚠ Module is likely NOT in Configuration Mode")
-            print("  ⚠ Set M0=LOW, M1=HIGH and try again")
-
-    print()
-    print("=" * 70)
-    print("TROUBLESHOOTING:")
-    print("=" * 70)
-    print("If you see ECHO (command echoed back):")
-    print("  1. Module is in Normal/WOR mode, not Config mode")
-    print("  2. Set M0=LOW (GND), M1=HIGH (3.3V)")
-    print("  3. Power cycle the module")
-    print("  4. Try again")
-    print()
-    print("If you see no response:")
-    print("  1. Check wiring (TX/RX swapped?)")
-    print("  2. Check baudrate (try 9600)")
-    print("  3. Check power (3.3V-5V)")
-    print()
+            out("  ⚠ Module is ECHOING the command!")
+            out("  ⚠ Module is likely NOT in Configuration Mode")
+            out("  ⚠ Set M0=LOW, M1=HIGH and try again")
+
+    out()
+    out("=" * 70)
+    out("TROUBLESHOOTING:")
+    out("=" * 70)
+    out("If you see ECHO (command echoed back):")
+    out("  1. Module is in Normal/WOR mode, not Config mode")
+    out("  2. Set M0=LOW (GND), M1=HIGH (3.3V)")
+    out("  3. Power cycle the module")
+    out("  4. Try again")
+    out()
+    out("If you see no response:")
+    out("  1. Check wiring (TX/RX swapped?)")
+    out("  2. Check baudrate (try 9600)")
+    out("  3. Check power (3.3V-5V)")
+    out()
 
     ser.close()
 
 except serial.SerialException as e:
+    flush_out()
     print(f"✗ Serial Error: {e}")
     sys.exit(1)
-except Exception as e:
+except (OSError, ValueError) as e:
+    flush_out()
     print(f"✗ Error: {e}")
-    import traceback
-    traceback.print_exc()
     sys.exit(1)
+finally:
+    # Whatever ends the run (including Ctrl+C or an unexpected error),
+    # the TX/RX lines collected so far are still shown
+    flush_out()
@@ -2,7 +2,6 @@
 import serial
 import time
 import argparse
-from datetime import datetime
 
 def main():
     parser = argparse.ArgumentParser(description="Send test messages via E22 LoRa module")
@@ -22,7 +21,7 @@ def main():
         with serial.Serial(args.port, baudrate=9600, timeout=1) as ser:
             while True:
                 counter += 1
-                timestamp = datetime.now().strftime("%H:%M:%S")
+                timestamp = time.strftime("%H:%M:%S")
                 message = f"{args.message} #{counter} {timestamp}\n"
 
                 # Send message
@@ -31,8 +30,9 @@ def main():
 
                 # Check for any received data
                 time.sleep(0.1)
-                if ser.in_waiting > 0:
-                    received = ser.read(ser.in_waiting).decode('utf-8', errors='ignore')
+                waiting = ser.in_waiting  # Query the input queue once
+                if waiting:
+                    received = ser.read(waiting).decode('utf-8', errors='ignore')
                     print(f"[{timestamp}] Received: {received.strip()}")
 
                 # Wait before next transmission